@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Build the optional compiled accelerators. All the other project metadata lives in ``pyproject.toml``.
+
+The accelerators are only built when the ``VT_COMMONS_BUILD_EXT`` environment variable is set to ``1``, e.g.
+``VT_COMMONS_BUILD_EXT=1 pip install .``. By default the package is built as a pure python ``py3-none-any`` wheel,
+which is what gets released to PyPI. Even when requested, the extensions are ``optional``, if they fail to build then
+the package is installed with its pure python implementations only.
+"""
+
+import os
+
+from setuptools import Extension, setup
+
+ext_modules = []
+if os.environ.get("VT_COMMONS_BUILD_EXT") == "1":
+    ext_modules.append(
+        Extension(
+            "vt.utils.commons.commons.collections._cutils",
+            sources=["src/vt/utils/commons/commons/collections/_cutils.c"],
+            optional=True,
+        )
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,94 @@
+/*
+ * Optional compiled accelerators for vt.utils.commons.commons.collections.utils.
+ *
+ * The pure python implementations in utils.py are the reference behaviour, the functions here must stay
+ * equivalent to them.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+/*
+ * first_true(ids, default_val, predicate, /)
+ *
+ * Same as the python loop:
+ *
+ *     for _id in ids:
+ *         if predicate(_id):
+ *             return _id
+ *     return default_val
+ *
+ * but without a python frame per element. When predicate is ``bool`` the truthiness of the element is tested
+ * directly instead of calling ``bool``.
+ */
+static PyObject *
+first_true(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *it, *item, *res;
+    PyObject *default_val, *predicate;
+    int truthy;
+
+    if (nargs != 3) {
+        PyErr_Format(PyExc_TypeError, "first_true() takes exactly 3 arguments (%zd given)", nargs);
+        return NULL;
+    }
+    default_val = args[1];
+    predicate = args[2];
+
+    it = PyObject_GetIter(args[0]);
+    if (it == NULL) {
+        return NULL;
+    }
+
+    while ((item = PyIter_Next(it)) != NULL) {
+        if (predicate == (PyObject *)&PyBool_Type) {
+            truthy = PyObject_IsTrue(item);
+        }
+        else {
+            res = PyObject_CallOneArg(predicate, item);
+            if (res == NULL) {
+                Py_DECREF(item);
+                Py_DECREF(it);
+                return NULL;
+            }
+            truthy = PyObject_IsTrue(res);
+            Py_DECREF(res);
+        }
+        if (truthy < 0) {
+            Py_DECREF(item);
+            Py_DECREF(it);
+            return NULL;
+        }
+        if (truthy) {
+            Py_DECREF(it);
+            return item;
+        }
+        Py_DECREF(item);
+    }
+    Py_DECREF(it);
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+    return Py_NewRef(default_val);
+}
+
+static PyMethodDef cutils_methods[] = {
+    {"first_true", (PyCFunction)(void (*)(void))first_true, METH_FASTCALL,
+     "first_true(ids, default_val, predicate, /)\n--\n\n"
+     "Get the first item of ids for which predicate is truthy else get default_val."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef cutils_module = {
+    PyModuleDef_HEAD_INIT,
+    "_cutils",
+    "Optional compiled accelerators for collections utilities.",
+    0,
+    cutils_methods
+};
+
+PyMODINIT_FUNC
+PyInit__cutils(void)
+{
+    return PyModuleDef_Init(&cutils_module);
+}
@@ -0,0 +1,5 @@
+from collections.abc import Callable, Iterable
+
+def first_true[T](
+    ids: Iterable[T], default_val: T, predicate: Callable[[T], object], /
+) -> T: ...
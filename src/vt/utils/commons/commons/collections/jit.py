@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Optional ``numpy`` vectorized and numba JIT compiled utilities for python projects related to collections.
+
+``get_first_true_vectorized()`` needs ``numpy`` and ``get_first_true_numba()`` needs ``numba`` (and hence, ``numpy``)
+to be installed to be usable. This module can still be imported without them, in which case the functions raise
+``ImportError`` when called.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import numpy as np  # type: ignore[import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover
+    _HAS_NUMPY = False
+else:
+    _HAS_NUMPY = True
+
+try:
+    from numba import njit  # type: ignore[import-not-found,unused-ignore]
+    from numba.extending import is_jitted  # type: ignore[import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover
+    _HAS_NUMBA = False
+else:
+    _HAS_NUMBA = True
+
+    # no cache=True: numba keys the predicate type by the address of the predicate object, so an on-disk cache entry
+    # never gets hit by another process and only piles up in __pycache__.
+    @njit
+    def _scan(arr, pred):  # pragma: no cover # runs as compiled code.
+        # numba compiles one specialization per (array type, predicate) pair and keeps it in memory for the process.
+        for i in range(arr.shape[0]):
+            if pred(arr[i]):
+                return i
+        return -1
+
+
+def get_first_true_vectorized(
+    arr: Any, default_val: Any, vectorized: Callable[[Any], Any]
+) -> Any:
+    """
+    Get the first element of the one dimensional ``numpy`` array ``arr`` for which the boolean mask computed by
+    ``vectorized`` is ``True`` else get the ``default_val``.
+
+    Same as ``vt.utils.commons.commons.collections.get_first_true()`` but the predicate is evaluated over the whole
+    ``arr`` in one go, e.g. by a ufunc based expression, instead of once per element in python.
+
+    The return type is ``Any`` as a match is a ``numpy`` scalar of the ``arr`` dtype, e.g. ``np.int64``, rather than
+    of the type of ``default_val``.
+
+    Examples:
+
+    >>> import numpy as np # doctest: +SKIP
+    >>> get_first_true_vectorized(np.array([-1, 0, 3, 5]), -9, lambda a: a > 0) # doctest: +SKIP
+    np.int64(3)
+    >>> get_first_true_vectorized(np.array([-1, 0]), -9, lambda a: a > 0) # doctest: +SKIP
+    -9
+
+    Error scenarios:
+
+    * supplied ``vectorized`` does not return a boolean mask:
+
+    >>> get_first_true_vectorized(np.array([0, 1, 5]), -9, lambda a: a) # doctest: +SKIP
+    Traceback (most recent call last):
+    ValueError: vectorized must return a boolean mask. Got dtype int64.
+
+    :param arr: one dimensional ``numpy`` array to scan.
+    :param default_val: value returned if the mask is ``True`` for no element of ``arr``.
+    :param vectorized: vectorized predicate. It takes the whole ``arr`` and must return a boolean mask array of the
+        same shape, e.g. ``lambda a: a > 0``.
+    :raises ImportError: if ``numpy`` is not installed.
+    :raises TypeError: if ``arr`` is not a ``numpy`` array.
+    :raises ValueError: if ``arr`` is not one dimensional or the mask returned by ``vectorized`` is not a boolean
+        array of the shape of ``arr``.
+    :return: the first element of ``arr``, as a ``numpy`` scalar, for which the mask is ``True`` or ``default_val`` if
+        the mask is ``True`` for no element.
+    """
+    if not _HAS_NUMPY:  # pragma: no cover
+        raise ImportError("numpy is required for get_first_true_vectorized().")
+    if not isinstance(arr, np.ndarray):
+        raise TypeError(f"arr must be a numpy array. Supplied {type(arr)}.")
+    if arr.ndim != 1:
+        raise ValueError(f"arr must be one dimensional. Got shape {arr.shape}.")
+
+    mask = np.asarray(vectorized(arr))
+    if mask.shape != arr.shape:
+        raise ValueError(
+            f"vectorized must return a mask of shape {arr.shape}. Got shape {mask.shape}."
+        )
+    # argmax on a non boolean mask finds the largest value rather than the first truthy one.
+    if mask.dtype != np.bool_:
+        raise ValueError(
+            f"vectorized must return a boolean mask. Got dtype {mask.dtype}."
+        )
+
+    if mask.size:
+        idx = mask.argmax()
+        if mask[idx]:
+            return arr[idx]
+    return default_val
+
+
+def get_first_true_numba(
+    arr: Any, default_val: Any, jit_predicate: Callable[[Any], bool]
+) -> Any:
+    """
+    Get the first element of the ``numpy`` array ``arr`` which returns ``True`` from the supplied ``jit_predicate``
+    else get the ``default_val``.
+
+    Same as ``vt.utils.commons.commons.collections.get_first_true()`` but the whole scan, including the
+    ``jit_predicate`` calls, runs as numba compiled code and stops at the first match.
+
+    The return type is ``Any`` as a match is a ``numpy`` scalar of the ``arr`` dtype, e.g. ``np.int64``, rather than
+    of the type of ``default_val``.
+
+    Examples:
+
+    >>> import numpy as np # doctest: +SKIP
+    >>> from numba import njit # doctest: +SKIP
+    >>> @njit # doctest: +SKIP
+    ... def positive(x):
+    ...     return x > 0
+    >>> get_first_true_numba(np.array([-1, 0, 3, 5]), -9, positive) # doctest: +SKIP
+    np.int64(3)
+    >>> get_first_true_numba(np.array([-1, 0]), -9, positive) # doctest: +SKIP
+    -9
+
+    Error scenarios:
+
+    * supplied predicate is not numba compiled:
+
+    >>> get_first_true_numba(np.array([-1, 0]), -9, lambda x: x > 0) # doctest: +SKIP
+    Traceback (most recent call last):
+    TypeError: jit_predicate must be a numba @njit compiled (x) -> bool function. Supplied <class 'function'>.
+
+    :param arr: one dimensional ``numpy`` array to scan.
+    :param default_val: value returned if no element of ``arr`` satisfies the ``jit_predicate``.
+    :param jit_predicate: numba ``@njit`` compiled predicate determining whether an element is satisfying.
+    :raises ImportError: if ``numba`` is not installed.
+    :raises TypeError: if ``jit_predicate`` is not a numba compiled function.
+    :return: the first element of ``arr``, as a ``numpy`` scalar, which returns ``True`` by the ``jit_predicate`` or
+        ``default_val`` if the ``jit_predicate`` returns ``True`` for no element.
+    """
+    if not _HAS_NUMBA:  # pragma: no cover
+        raise ImportError("numba is required for get_first_true_numba().")
+    if not is_jitted(jit_predicate):
+        raise TypeError(
+            f"jit_predicate must be a numba @njit compiled (x) -> bool function. Supplied {type(jit_predicate)}."
+        )
+
+    idx = _scan(arr, jit_predicate)
+    return arr[idx] if idx >= 0 else default_val
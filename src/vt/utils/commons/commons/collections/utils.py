@@ -5,7 +5,18 @@
 Reusable common utilities for python projects related to collections.
 """
 
-from collections.abc import Sequence, Callable, Iterator
+from collections.abc import Sequence, Callable, Iterable, Iterator
+from operator import truth
+from types import BuiltinFunctionType, FunctionType
+
+try:
+    from vt.utils.commons.commons.collections._cutils import (
+        first_true as _c_first_true,
+    )
+except ImportError:  # pragma: no cover # the compiled accelerator is optional.
+    _HAS_CUTILS = False
+else:
+    _HAS_CUTILS = True
 
 
 def get_first_true[T](
@@ -29,6 +40,18 @@ def get_first_true[T](
         >>> get_first_true([1, 2, 3], -1, lambda x: False)
         -1
 
+    * First truthy id is returned if the ``predicate`` is ``bool`` or ``operator.truth``::
+
+        >>> get_first_true([0, '', 2, 3], -1, bool)
+        2
+
+        >>> import operator
+        >>> get_first_true([None, [], (), 'a'], 'z', operator.truth)
+        'a'
+
+        >>> get_first_true([0, None], -1, bool)
+        -1
+
     Error scenarios:
 
     * supplied predicate is not a callable::
@@ -45,6 +68,9 @@ def get_first_true[T](
         Traceback (most recent call last):
         TypeError: <lambda>() missing 1 required positional argument: 'y'
 
+    Use ``vt.utils.commons.commons.collections.jit.get_first_true_vectorized()`` to scan a ``numpy`` array with a
+    vectorized predicate instead.
+
     :param ids: sequence of id(s) from which the first ever ``predicate`` determined truthy id is to be found.
     :param default_val: value returned if no id is found as truthy from the ``ids`` list according to the supplied
         ``predicate``.
@@ -54,12 +80,34 @@ def get_first_true[T](
     :return: the first id from the list of ``ids`` which returns ``True`` by the ``predicate`` or ``default_val`` if
         the ``predicate`` returns ``True`` for no id(s).
     """
-    if not callable(predicate):
-        raise TypeError(
-            f"predicate must be a (x) -> bool Callable. Supplied {type(predicate)}."
-        )
-
-    for _id in iter_provider(ids):
+    # python function predicates, the common case, go straight to the python loop below after this one check.
+    if type(predicate) is not FunctionType:
+        if not callable(predicate):
+            raise TypeError(
+                f"predicate must be a (x) -> bool Callable. Supplied {type(predicate)}."
+            )
+
+        if predicate is bool or predicate is truth:
+            # the compiled loop only pays off when it does not call back into python code.
+            if _HAS_CUTILS and iter_provider is iter:
+                return _c_first_true(ids, default_val, bool)
+            # truthiness is checked directly rather than calling the predicate for every id.
+            for _id in ids if iter_provider is iter else iter_provider(ids):
+                if _id:
+                    return _id
+            return default_val
+
+        if (
+            _HAS_CUTILS
+            and iter_provider is iter
+            and type(predicate) is BuiltinFunctionType
+        ):
+            return _c_first_true(ids, default_val, predicate)
+
+    # the for loop gets the iterator of ids itself, so the default iter_provider need not be called.
+    _ids: Iterable[T] = ids if iter_provider is iter else iter_provider(ids)
+
+    for _id in _ids:
         if predicate(_id):
             return _id
     return default_val
@@ -83,6 +131,25 @@ def get_last_true[T](
         >>> get_last_true([1, 2, 3], -1, lambda x: False)
         -1
 
+    * Last id satisfying the ``predicate`` is returned::
+
+        >>> get_last_true([1, 2, 3, 4], -1, lambda x: x % 2 == 1)
+        3
+
+    * Default id is returned for empty ``ids``::
+
+        >>> get_last_true((), -1, lambda x: True)
+        -1
+
+    * Other sequences are supported too::
+
+        >>> from collections import deque
+        >>> get_last_true(deque([1, 2, 3, 4]), -1, lambda x: x % 2 == 1)
+        3
+
+        >>> get_last_true(range(10), -1, lambda x: x < 5)
+        4
+
     Error scenarios:
 
     * supplied predicate is not a callable::
@@ -107,7 +174,16 @@ def get_last_true[T](
     :return: the last id from the list of ``ids`` which returns ``True`` by the ``predicate`` or ``default_val`` if
         the ``predicate`` returns ``True`` for no id(s).
     """
-    return get_first_true(ids, default_val, predicate, reversed)
+    if not callable(predicate):
+        raise TypeError(
+            f"predicate must be a (x) -> bool Callable. Supplied {type(predicate)}."
+        )
+
+    # loop over reversed(ids) here rather than going through get_first_true(..., reversed) to avoid the extra call.
+    for _id in reversed(ids):
+        if predicate(_id):
+            return _id
+    return default_val
 
 
 def get_first_non_none[T](
@@ -10,6 +10,7 @@ from vt.utils.commons.commons.core_py.base import MISSING as MISSING
 from vt.utils.commons.commons.core_py.base import Missing as Missing
 from vt.utils.commons.commons.core_py.base import UNSET as UNSET
 from vt.utils.commons.commons.core_py.base import Unset as Unset
+from vt.utils.commons.commons.core_py.base import SentinelKind as SentinelKind
 # endregion
 
 # region utility functions
@@ -28,6 +29,7 @@ from vt.utils.commons.commons.core_py.utils import alt_if_missing as alt_if_miss
 from vt.utils.commons.commons.core_py.utils import is_missing as is_missing
 from vt.utils.commons.commons.core_py.utils import alt_if_ellipses as alt_if_ellipses
 from vt.utils.commons.commons.core_py.utils import is_ellipses as is_ellipses
+from vt.utils.commons.commons.core_py.utils import sentinel_kind as sentinel_kind
 from vt.utils.commons.commons.core_py.utils import fallback_on_none as fallback_on_none
 from vt.utils.commons.commons.core_py.utils import (
     fallback_on_none_strict as fallback_on_none_strict,
@@ -5,18 +5,56 @@
 Reusable interfaces and sentinel objects related to core python.
 """
 
-from typing import Final
+from enum import IntEnum
+from typing import Any, Final, Self
 
 
 class Sentinel:
     """
     Class denoting sentinel values.
+
+    Subclasses are free to take constructor arguments and to have more than one instance:
+
+    >>> class Named(Sentinel):
+    ...     def __init__(self, name):
+    ...         self.name = name
+    >>> assert Named('a') is not Named('a')
     """
 
     pass
 
 
-class Missing(Sentinel):
+class _SingletonSentinel(Sentinel):
+    """
+    Sentinel with exactly one instance per subclass, so that it can always be checked by identity
+    (``obj is MISSING``), even after it is constructed again, copied or pickled.
+
+    >>> import copy, pickle
+    >>> assert Missing() is MISSING
+    >>> assert copy.copy(MISSING) is MISSING and copy.deepcopy(MISSING) is MISSING
+    >>> assert pickle.loads(pickle.dumps(UNSET)) is UNSET
+    >>> assert MISSING is not UNSET
+    """
+
+    def __new__(cls) -> Self:
+        # look in the class' own namespace so that a subclass does not reuse its parent's instance.
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
+    def __reduce__(self) -> tuple[type[Self], tuple[()]]:
+        return type(self), ()
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+
+class Missing(_SingletonSentinel):
     """
     A Sentinel type to represent a missing value. Can be used:
 
@@ -26,7 +64,7 @@ class Missing(Sentinel):
     pass
 
 
-class Unset(Sentinel):
+class Unset(_SingletonSentinel):
     """
     Sentinel type that can be used to unset a previously set value.
     """
@@ -45,3 +83,32 @@ UNSET: Final[Unset] = Unset()
 """
 Sentinel that can be used to unset a previously set value.
 """
+
+
+class SentinelKind(IntEnum):
+    """
+    Kind of sentinel an object is. ``NONE`` is ``0`` and hence, falsy while all the sentinel kinds are truthy.
+
+    >>> assert not SentinelKind.NONE
+    >>> assert SentinelKind.MISSING and SentinelKind.UNSET and SentinelKind.ELLIPSES
+    """
+
+    NONE = 0
+    """
+    Not a sentinel.
+    """
+
+    MISSING = 1
+    """
+    The ``MISSING`` sentinel.
+    """
+
+    UNSET = 2
+    """
+    The ``UNSET`` sentinel.
+    """
+
+    ELLIPSES = 3
+    """
+    The ``...`` (``Ellipsis``) sentinel.
+    """
@@ -5,10 +5,16 @@
 Reusable utilities related to core python.
 """
 
-from collections.abc import Callable, Sequence
-from typing import Any, cast, TypeGuard, overload, Literal
+from collections.abc import Sequence
+from typing import Any, TypeGuard, overload, Literal
 
-from vt.utils.commons.commons.core_py.base import MISSING, Missing, UNSET, Unset
+from vt.utils.commons.commons.core_py.base import (
+    MISSING,
+    Missing,
+    UNSET,
+    Unset,
+    SentinelKind,
+)
 
 
 def is_missing[T](obj: T) -> TypeGuard[Missing]:
@@ -185,29 +191,19 @@ def not_none_not_missing[T](val: T | None | Missing) -> TypeGuard[T]:
     return not_none_not_sentinel(val, sentinel=MISSING)
 
 
-def _alt_if_predicate_true[T, U](
-    obj: Any | U, alt: T, predicate: Callable[[Any | U], bool]
-) -> T:
+def _type_mismatch_error(obj: Any, alt: Any) -> TypeError:
     """
-    Get an alternate object ``alt`` if the queried object ``obj`` is ``MISSING``, i.e. it is not supplied by the caller.
+    Build the error raised by the ``alt_if_*()`` functions when ``obj`` and ``alt`` are of different types.
 
-    Note::
+    Shared by the ``alt_if_*()`` functions so that the message stays in one place and is only formatted when raised.
 
-        Returned value is always of the type of alt object.
-
-    :param obj: object to be tested whether it was fulfills the ``predicate`` or not.
-    :param predicate: A predicate that ``obj`` needs to fulfill to be returned from this method.
-    :param alt: alternate object to be returned if ``obj`` does not fulfill the ``predicate``.
-    :return: ``obj`` if it fulfills the ``predicate`` else ``alt``.
+    >>> _type_mismatch_error('a', 2)
+    TypeError("Unexpected type: `obj` and `alt` must be of the same type. type(obj): <class 'str'>, type(alt): <class 'int'>")
     """
-    if predicate(obj):
-        return alt
-    if type(obj) is not type(alt):
-        raise TypeError(
-            f"Unexpected type: `obj` and `alt` must be of the same type. type(obj): {type(obj)}, "
-            f"type(alt): {type(alt)}"
-        )
-    return alt if is_missing(obj) else cast(T, obj)
+    return TypeError(
+        f"Unexpected type: `obj` and `alt` must be of the same type. type(obj): {type(obj)}, "
+        f"type(alt): {type(alt)}"
+    )
 
 
 def alt_if_missing[T](obj: Any | Missing, alt: T) -> T:
@@ -267,11 +263,21 @@ def alt_if_missing[T](obj: Any | Missing, alt: T) -> T:
     Traceback (most recent call last):
     TypeError: Unexpected type: `obj` and `alt` must be of the same type. type(obj): <class 'list'>, type(alt): <class 'tuple'>
 
+    * Types are compared by identity, hence a subclass instance is not accepted for its base type:
+
+    >>> alt_if_missing(True, 1)
+    Traceback (most recent call last):
+    TypeError: Unexpected type: `obj` and `alt` must be of the same type. type(obj): <class 'bool'>, type(alt): <class 'int'>
+
     :param obj: object to be tested whether it was supplied by caller or not.
     :param alt: alternate object to be returned if ``obj`` was not supplied by the caller.
     :return: ``obj`` if it was supplied by the caller else ``alt``.
     """
-    return _alt_if_predicate_true(obj, alt, is_missing)
+    if obj is MISSING:
+        return alt
+    if type(obj) is not type(alt):
+        raise _type_mismatch_error(obj, alt)
+    return obj
 
 
 def alt_if_unset[T](obj: Any | Unset, alt: T) -> T:
@@ -332,11 +338,21 @@ def alt_if_unset[T](obj: Any | Unset, alt: T) -> T:
     Traceback (most recent call last):
     TypeError: Unexpected type: `obj` and `alt` must be of the same type. type(obj): <class 'list'>, type(alt): <class 'tuple'>
 
+    * Types are compared by identity, hence a subclass instance is not accepted for its base type:
+
+    >>> alt_if_unset(True, 1)
+    Traceback (most recent call last):
+    TypeError: Unexpected type: `obj` and `alt` must be of the same type. type(obj): <class 'bool'>, type(alt): <class 'int'>
+
     :param obj: object to be tested whether it was deliberately unset by the caller or not.
     :param alt: alternate object to be returned if ``obj`` was not supplied by the caller.
     :return: ``alt`` if ``obj`` was deliberately unset by the caller, else ``obj``.
     """
-    return _alt_if_predicate_true(obj, alt, is_unset)
+    if obj is UNSET:
+        return alt
+    if type(obj) is not type(alt):
+        raise _type_mismatch_error(obj, alt)
+    return obj
 
 
 def is_ellipses(obj: Any) -> bool:
@@ -355,6 +371,43 @@ def is_ellipses(obj: Any) -> bool:
     return obj is ...
 
 
+# sentinels live as long as the interpreter, hence their id() can never be reused by another object.
+_SENTINEL_KINDS: dict[int, SentinelKind] = {
+    id(MISSING): SentinelKind.MISSING,
+    id(UNSET): SentinelKind.UNSET,
+    id(...): SentinelKind.ELLIPSES,
+}
+
+
+def sentinel_kind(obj: Any) -> SentinelKind:
+    """
+    Determine which sentinel, if any, the ``obj`` is, using a single lookup.
+
+    ``if sentinel_kind(obj):`` can be used in place of ``if is_missing(obj) or is_unset(obj) or is_ellipses(obj):``
+    as ``SentinelKind.NONE`` is falsy.
+
+    Examples:
+
+    >>> sentinel_kind(MISSING)
+    <SentinelKind.MISSING: 1>
+    >>> sentinel_kind(UNSET)
+    <SentinelKind.UNSET: 2>
+    >>> sentinel_kind(...)
+    <SentinelKind.ELLIPSES: 3>
+
+    * non-sentinels, including falsy ones, are of kind ``SentinelKind.NONE``:
+
+    >>> sentinel_kind(None)
+    <SentinelKind.NONE: 0>
+    >>> sentinel_kind(0) or sentinel_kind('') or sentinel_kind([]) or sentinel_kind(object())
+    <SentinelKind.NONE: 0>
+
+    :param obj: object to be tested whether it is a sentinel.
+    :return: the ``SentinelKind`` of ``obj``, ``SentinelKind.NONE`` if ``obj`` is not a sentinel.
+    """
+    return _SENTINEL_KINDS.get(id(obj), SentinelKind.NONE)
+
+
 def alt_if_ellipses[T](obj, alt: T) -> T:
     """
     Get an alternate object ``alt`` if the queried object ``obj`` is ``...``, i.e. it is not supplied by the caller or
@@ -414,11 +467,21 @@ def alt_if_ellipses[T](obj, alt: T) -> T:
     Traceback (most recent call last):
     TypeError: Unexpected type: `obj` and `alt` must be of the same type. type(obj): <class 'list'>, type(alt): <class 'tuple'>
 
+    * Types are compared by identity, hence a subclass instance is not accepted for its base type:
+
+    >>> alt_if_ellipses(True, 1)
+    Traceback (most recent call last):
+    TypeError: Unexpected type: `obj` and `alt` must be of the same type. type(obj): <class 'bool'>, type(alt): <class 'int'>
+
     :param obj: object to be tested whether it was supplied as ellipses by caller or not.
     :param alt: alternate object to be returned if ``obj`` is supplied as ellipses by the caller.
     :return: ``obj`` if it was supplied as ellipses by the caller, else ``alt``.
     """
-    return _alt_if_predicate_true(obj, alt, is_ellipses)
+    if obj is ...:
+        return alt
+    if type(obj) is not type(alt):
+        raise _type_mismatch_error(obj, alt)
+    return obj
 
 
 def fallback_on_none[T](value: T | None, default_val: T | None) -> T | None:
@@ -461,12 +524,14 @@ def fallback_on_none[T](value: T | None, default_val: T | None) -> T | None:
     :param default_val: returned if ``value`` is ``None``.
     :return: ``default_val`` if ``value`` is ``None`` else ``value``.
     """
-    return default_val if value is None else value
+    return value if value is not None else default_val
 
 
 def fallback_on_none_strict[T](value: T | None, default_val: T) -> T:
     """
-    Same as ``fallback_on_non_strict()`` but has an assertion guarantee that ``default_val`` is non-``None``.
+    Same as ``fallback_on_none()`` but has an assertion guarantee that ``default_val`` is non-``None``.
+
+    The guarantee is a plain ``assert`` and hence, is compiled out entirely (check and message) under ``python -O``.
 
     Examples:
 
@@ -483,7 +548,7 @@ def fallback_on_none_strict[T](value: T | None, default_val: T) -> T:
     :return: ``default_val`` if ``value`` is ``None`` else ``value``.
     """
     assert default_val is not None, "default_val must not be None."
-    return cast(T, fallback_on_none(value, default_val))
+    return value if value is not None else default_val
 
 
 def strictly_int(value: object) -> TypeGuard[int]:
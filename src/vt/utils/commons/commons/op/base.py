@@ -6,7 +6,9 @@ Reusable interfaces for python projects related to operations.
 """
 
 from __future__ import annotations
+import os
 from abc import abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import Protocol, override, final
 
@@ -14,6 +16,9 @@ from typing import Protocol, override, final
 class ReversibleOp(Protocol):
     """
     Operation that can be reversed or act in the reversed mode.
+
+    This is a static protocol and ``isinstance(x, ReversibleOp)`` is intentionally not supported. Use
+    ``vt.utils.commons.commons.op.runtime.ReversibleOpRT`` where a runtime check is really needed.
     """
 
     # __always_true = AlwaysTrue()
@@ -65,11 +70,36 @@ class AlwaysFalse(ReversibleOp):
 
 
 # region Root dir related operations
+@lru_cache(maxsize=1)
+def _cwd_cached() -> Path:
+    """
+    Current working directory, resolved once per process so that defaulting to it does not hit ``getcwd()`` on every
+    call. Changes made later by ``os.chdir()`` in the same process are not picked up.
+
+    >>> assert _cwd_cached() == Path.cwd()
+    >>> assert _cwd_cached() is _cwd_cached()
+
+    :return: the cached current working directory.
+    """
+    return Path.cwd()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_cwd_cached.cache_clear)
+
+
 class RootDirOp(Protocol):
     """
     Perform operations on the ``root_dir``.
+
+    This is a static protocol and ``isinstance(x, RootDirOp)`` is intentionally not supported. Prefer duck-typing,
+    i.e. accessing ``x.root_dir``, and use ``vt.utils.commons.commons.op.runtime.RootDirOpRT`` where a runtime check is
+    really needed.
     """
 
+    # empty slots so that implementations declaring their own __slots__ do not get a __dict__ through this protocol.
+    __slots__ = ()
+
     @property
     @abstractmethod
     def root_dir(self) -> Path:
@@ -80,13 +110,36 @@ class RootDirOp(Protocol):
 
 
 class CWDRootDirOp(RootDirOp):
-    def __init__(self, root_dir=Path.cwd()):
+    """
+    ``RootDirOp`` over a fixed root directory path, defaulting to the current working directory. The default is
+    resolved once per process, so later ``os.chdir()`` calls are not reflected in it.
+
+    Instances only hold the root directory in a slot and hence, carry no per-instance ``__dict__``. Subclasses must
+    also declare ``__slots__`` to retain this.
+
+    >>> assert not hasattr(CWDRootDirOp(), '__dict__')
+
+    Instances can still be weakly referenced:
+
+    >>> import weakref
+    >>> op = CWDRootDirOp()
+    >>> assert weakref.ref(op)() is op
+    """
+
+    __slots__ = ("_root_dir", "__weakref__")
+
+    def __init__(self, root_dir: Path | None = None):
         """
         Perform operations on the root_dir.
 
-        :param root_dir: the path to the root directory.
+        >>> assert CWDRootDirOp().root_dir == Path.cwd()
+        >>> assert CWDRootDirOp(Path('tmp')).root_dir == Path('tmp')
+
+        :param root_dir: the path to the root directory. Defaults to the current working directory as resolved on the
+            first defaulted call in this process. It is cached for the life of the process and hence, does not follow
+            later ``os.chdir()`` calls. Pass ``Path.cwd()`` explicitly to get the directory at the time of the call.
         """
-        self._root_dir = root_dir
+        self._root_dir = _cwd_cached() if root_dir is None else root_dir
 
     @override
     @property
@@ -121,6 +174,13 @@ class RootDirOps:
 
             >>> assert Path('tmp') == RootDirOps.strictly_one_required(root_dir_op=RootDirOps.from_path(Path('tmp')))
 
+          * OK: only root-dir-op supplied, it is used even if it is falsy:
+
+            >>> class _FalsyRootDirOp(CWDRootDirOp):
+            ...     def __bool__(self):
+            ...         return False
+            >>> assert Path('tmp') == RootDirOps.strictly_one_required(root_dir_op=_FalsyRootDirOp(Path('tmp')))
+
           * At least one of ``root_dir`` or ``root_dir_op`` must be provided:
 
             >>> RootDirOps.strictly_one_required(None, None)
@@ -142,20 +202,26 @@ class RootDirOps:
         :raises ValueError: when both ``root_dir`` and ``root_dir_op`` are supplied.
         :return: root dir path.
         """
-        if root_dir and root_dir_op:
-            raise ValueError(
-                f"{root_dir_str} and {root_dir_op_str} are not allowed together."
-            )
-        if root_dir:
+        # valid calls supply exactly one of the two, so they resolve in two None checks and the error messages are
+        # only built on the error paths.
+        if root_dir is not None:
+            if root_dir_op is not None:
+                raise ValueError(
+                    f"{root_dir_str} and {root_dir_op_str} are not allowed together."
+                )
             return root_dir
-        if root_dir_op:
+        if root_dir_op is not None:
             return root_dir_op.root_dir
         raise ValueError(f"Either {root_dir_str} or {root_dir_op_str} is required.")
 
     @staticmethod
-    def from_path(root_dir: Path = Path.cwd()) -> CWDRootDirOp:
+    def from_path(root_dir: Path | None = None) -> CWDRootDirOp:
         """
-        :param root_dir: path to root-dir.
+        >>> assert RootDirOps.from_path().root_dir == Path.cwd()
+
+        :param root_dir: path to root-dir. Defaults to the current working directory as resolved on the first
+            defaulted call in this process. It is cached for the life of the process and hence, does not follow later
+            ``os.chdir()`` calls. Pass ``Path.cwd()`` explicitly to get the directory at the time of the call.
         :return: a root dir operation for the supplied path.
         """
         return CWDRootDirOp(root_dir)
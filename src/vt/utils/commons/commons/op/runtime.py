@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Runtime checkable variants of the operation interfaces.
+
+``RootDirOp`` and ``ReversibleOp`` are plain (static only) protocols and hence, do not support ``isinstance()``
+checks. Import the variants from this module only where such a runtime check is really needed, as a runtime protocol
+check looks up every protocol member on the checked object.
+"""
+
+from typing import Protocol, runtime_checkable
+
+from vt.utils.commons.commons.op.base import ReversibleOp, RootDirOp
+
+
+@runtime_checkable
+class RootDirOpRT(RootDirOp, Protocol):
+    """
+    Runtime checkable ``RootDirOp``.
+
+    >>> from pathlib import Path
+    >>> from vt.utils.commons.commons.op import CWDRootDirOp
+    >>> isinstance(CWDRootDirOp(Path('tmp')), RootDirOpRT)
+    True
+
+    * structurally conforming objects are accepted:
+
+    >>> class _DuckRootDirOp:
+    ...     root_dir = Path('tmp')
+    >>> isinstance(_DuckRootDirOp(), RootDirOpRT)
+    True
+
+    >>> isinstance(object(), RootDirOpRT)
+    False
+    """
+
+
+@runtime_checkable
+class ReversibleOpRT(ReversibleOp, Protocol):
+    """
+    Runtime checkable ``ReversibleOp``.
+
+    >>> isinstance(ReversibleOp.true(), ReversibleOpRT)
+    True
+
+    >>> isinstance(object(), ReversibleOpRT)
+    False
+    """
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Tests for the optional compiled ``_cutils`` accelerator and the pure python fallback of
+``vt.utils.commons.commons.collections.utils.get_first_true()``.
+
+Both are checked against the same reference semantics, irrespective of whether the accelerator got built.
+"""
+
+import operator
+
+import pytest
+
+from vt.utils.commons.commons.collections import utils
+
+
+def reference_first_true(ids, default_val, predicate):
+    for _id in ids:
+        if predicate(_id):
+            return _id
+    return default_val
+
+
+def raising_gen(exc):
+    yield 0
+    raise exc
+
+
+class FalsyBoom:
+    def __bool__(self):
+        raise RuntimeError("boom")
+
+
+CASES = [
+    pytest.param(lambda: [0, "", 2, 3], -1, bool, id="bool-hit"),
+    pytest.param(lambda: [0, None, ()], -1, bool, id="bool-default"),
+    pytest.param(lambda: [None, [], "a"], "z", operator.truth, id="truth-hit"),
+    pytest.param(lambda: [], -1, operator.truth, id="empty"),
+    pytest.param(lambda: [0, 1, print], -1, callable, id="builtin-hit"),
+    pytest.param(lambda: [0, 1], -1, callable, id="builtin-default"),
+    pytest.param(lambda: [-1, 0, 3], -9, lambda x: x > 0, id="python-predicate"),
+    pytest.param(lambda: (x for x in [0, 0, 4]), -1, bool, id="generator"),
+    pytest.param(lambda: iter((0, 5, 6)), -1, bool, id="iterator"),
+    pytest.param(lambda: {0: "a", 7: "b"}.keys(), -1, bool, id="dict-keys"),
+    pytest.param(lambda: range(0, 3), -1, bool, id="range"),
+]
+
+ERROR_CASES = [
+    pytest.param(lambda: [[], 5], -1, len, TypeError, id="builtin-predicate-raises"),
+    pytest.param(
+        lambda: [0, 1],
+        -1,
+        lambda x: 1 / x,
+        ZeroDivisionError,
+        id="python-predicate-raises",
+    ),
+    pytest.param(lambda: [0, FalsyBoom()], -1, bool, RuntimeError, id="bool-raises"),
+    pytest.param(
+        lambda: [1, 2],
+        -1,
+        lambda x: FalsyBoom(),
+        RuntimeError,
+        id="predicate-result-bool-raises",
+    ),
+    pytest.param(
+        lambda: raising_gen(KeyError("k")), -1, bool, KeyError, id="iteration-raises"
+    ),
+]
+
+
+@pytest.fixture
+def c_first_true():
+    _cutils = pytest.importorskip("vt.utils.commons.commons.collections._cutils")
+    return _cutils.first_true
+
+
+@pytest.fixture(params=["cutils", "fallback"])
+def first_true(request, monkeypatch):
+    if request.param == "cutils":
+        if not utils._HAS_CUTILS:
+            pytest.skip("compiled _cutils accelerator is not built.")
+    else:
+        monkeypatch.setattr(utils, "_HAS_CUTILS", False)
+    return utils.get_first_true
+
+
+# region compiled first_true called directly
+@pytest.mark.parametrize("ids, default_val, predicate", CASES)
+def test_c_first_true_matches_reference(c_first_true, ids, default_val, predicate):
+    result = c_first_true(ids(), default_val, predicate)
+    assert result == reference_first_true(ids(), default_val, predicate)
+
+
+def test_c_first_true_returns_same_object(c_first_true):
+    hit, default = [1], object()
+    assert c_first_true([[], hit], default, bool) is hit
+    assert c_first_true([[]], default, bool) is default
+
+
+@pytest.mark.parametrize("ids, default_val, predicate, exc", ERROR_CASES)
+def test_c_first_true_propagates_errors(c_first_true, ids, default_val, predicate, exc):
+    with pytest.raises(exc):
+        reference_first_true(ids(), default_val, predicate)
+    with pytest.raises(exc):
+        c_first_true(ids(), default_val, predicate)
+
+
+def test_c_first_true_stops_at_first_hit(c_first_true):
+    seen = []
+    assert c_first_true([0, 2, 3], -1, lambda x: seen.append(x) or x) == 2
+    assert seen == [0, 2]
+
+
+def test_c_first_true_non_iterable(c_first_true):
+    with pytest.raises(TypeError):
+        c_first_true(5, -1, bool)
+
+
+@pytest.mark.parametrize("args", [(), ([1],), ([1], -1), ([1], -1, bool, None)])
+def test_c_first_true_wrong_arg_count(c_first_true, args):
+    with pytest.raises(
+        TypeError,
+        match=rf"first_true\(\) takes exactly 3 arguments \({len(args)} given\)",
+    ):
+        c_first_true(*args)
+
+
+# endregion
+
+
+# region get_first_true with and without the accelerator
+@pytest.mark.parametrize("ids, default_val, predicate", CASES)
+def test_get_first_true_matches_reference(first_true, ids, default_val, predicate):
+    result = first_true(ids(), default_val, predicate)
+    assert result == reference_first_true(ids(), default_val, predicate)
+
+
+@pytest.mark.parametrize("ids, default_val, predicate, exc", ERROR_CASES)
+def test_get_first_true_propagates_errors(first_true, ids, default_val, predicate, exc):
+    with pytest.raises(exc):
+        first_true(ids(), default_val, predicate)
+
+
+def test_get_first_true_custom_iter_provider(first_true):
+    assert first_true([1, 0, 3], -1, bool, reversed) == 3
+
+
+# endregion
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# coding=utf-8
+
+"""
+Tests for ``vt.utils.commons.commons.collections.jit``, skipped when ``numpy`` or ``numba`` are not installed.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from vt.utils.commons.commons.collections import get_first_true
+from vt.utils.commons.commons.collections.jit import (
+    get_first_true_numba,
+    get_first_true_vectorized,
+)
+
+
+# region numpy vectorized scan
+def test_vectorized_hit():
+    result = get_first_true_vectorized(np.array([-1, 0, 3, 5]), -9, lambda a: a > 0)
+    assert result == 3
+    assert isinstance(result, np.integer)
+
+
+def test_vectorized_all_false():
+    assert get_first_true_vectorized(np.array([-1, 0, -3]), -9, lambda a: a > 0) == -9
+
+
+def test_vectorized_empty():
+    assert get_first_true_vectorized(np.array([], dtype=int), -9, lambda a: a > 0) == -9
+
+
+def test_vectorized_matches_scalar_scan():
+    ids = np.array([0, -2, 0, 7, 4])
+    assert get_first_true_vectorized(ids, -9, lambda a: a != 0) == get_first_true(
+        ids, -9, lambda x: x != 0
+    )
+
+
+def test_vectorized_non_ndarray():
+    with pytest.raises(
+        TypeError, match=r"arr must be a numpy array\. Supplied <class 'list'>\."
+    ):
+        get_first_true_vectorized([-1, 0, 3], -9, lambda a: a > 0)
+
+
+def test_vectorized_non_1d():
+    with pytest.raises(
+        ValueError, match=r"arr must be one dimensional\. Got shape \(2, 2\)\."
+    ):
+        get_first_true_vectorized(np.array([[-1, -2], [3, 4]]), -9, lambda a: a > 0)
+
+
+def test_vectorized_wrong_mask_shape():
+    with pytest.raises(ValueError, match=r"mask of shape \(3,\)\. Got shape \(\)\."):
+        get_first_true_vectorized(np.array([-1, 0, 3]), -9, lambda a: True)
+
+
+def test_vectorized_non_bool_mask():
+    # an int mask would otherwise resolve to the largest value, 5, rather than the first truthy one.
+    with pytest.raises(
+        ValueError, match=r"vectorized must return a boolean mask\. Got dtype int"
+    ):
+        get_first_true_vectorized(np.array([0, 1, 5]), -1, lambda a: a)
+
+
+# endregion
+
+
+# region numba compiled scan
+@pytest.fixture(scope="module")
+def positive():
+    numba = pytest.importorskip("numba")
+
+    @numba.njit
+    def _positive(x):
+        return x > 0
+
+    return _positive
+
+
+def test_numba_hit(positive):
+    result = get_first_true_numba(np.array([-1, 0, 3, 5]), -9, positive)
+    assert result == 3
+    assert isinstance(result, np.integer)
+
+
+def test_numba_default(positive):
+    assert get_first_true_numba(np.array([-1, 0]), -9, positive) == -9
+
+
+def test_numba_empty(positive):
+    assert get_first_true_numba(np.array([], dtype=np.int64), -9, positive) == -9
+
+
+def test_numba_float_array(positive):
+    assert get_first_true_numba(np.array([-0.5, 0.25]), None, positive) == 0.25
+
+
+def test_numba_non_jitted_predicate_rejected(positive):
+    with pytest.raises(
+        TypeError,
+        match=r"jit_predicate must be a numba @njit compiled \(x\) -> bool function\. "
+        r"Supplied <class 'function'>\.",
+    ):
+        get_first_true_numba(np.array([-1, 0]), -9, lambda x: x > 0)
+
+
+# endregion